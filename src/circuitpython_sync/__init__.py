@@ -1,27 +1,48 @@
-import asyncio
 import base64
-import json
+import codecs
 import os
+import queue
 import shutil
 import sys
 import threading
 import time
+import uuid
 import webbrowser
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
 from fnmatch import fnmatch
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Iterator
 from urllib.parse import urljoin
 
 import requests
-import websocket
-import websockets
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+
+try:
+    # Optional, faster JSON decoding of device responses
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 DEFAULT_URL = "http://circuitpython.local/"
 DEFAULT_PASS = "passw0rd"
-DEFAULT_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+# Requests carry no JSON body, Accept alone selects JSON directory listings
+DEFAULT_HEADERS = {"Accept": "application/json"}
+UPLOAD_HEADERS = {"Content-Type": "application/octet-stream"}
+DOWNLOAD_HEADERS = {"Accept": "*/*"}
 DEFAULT_KWARGS = {"allow_redirects": True, "timeout": 5}
 DEFAULT_CACHE_PATH = "CircuitPython"
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_POOL_SIZE = 16
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DISK_INFO_TTL = 2.0
+# Downloads in progress are written to ".cpsync-<random>.part" next to the target
+PART_PREFIX = ".cpsync-"
+PART_SUFFIX = ".part"
+# FAT stores modification times with a 2 second resolution
+MTIME_TOLERANCE_NS = 2_000_000_000
 
 # ANSI color codes
 GREEN = "\033[32m"
@@ -29,6 +50,9 @@ YELLOW = "\033[33m"
 RED = "\033[31m"
 RESET = "\033[0m"
 
+# ptree colors by file extension, anything else is RED
+EXT_COLORS = {"py": GREEN, "mpy": YELLOW}
+
 
 class ClientRequestError(Exception):
     pass
@@ -63,6 +87,25 @@ def request_exception_wrapper(func):
     return wrapper
 
 
+class _HeaderAuth(AuthBase):
+    """
+    Requests auth that sets a precomputed Authorization header.
+
+    Unlike a plain session header, an auth object also stops requests from
+    looking up (and applying) ~/.netrc credentials on every request.
+
+    Args:
+        header: The value of the Authorization header.
+    """
+
+    def __init__(self, header: str):
+        self.header = header
+
+    def __call__(self, r):
+        r.headers["Authorization"] = self.header
+        return r
+
+
 class Client:
     """
     Client for interacting with a CircuitPython device via its web workflow.
@@ -71,34 +114,77 @@ class Client:
         url: The base URL of the CircuitPython device.
         password: The password for authenticating with the device.
         headers: A dictionary of HTTP headers to send with requests.
+        pool_size: The maximum number of keep-alive connections kept to the device.
         **kwargs: Additional keyword arguments to pass to the requests library.
     """
 
-    def __init__(self, url=DEFAULT_URL, password=DEFAULT_PASS, headers=None, **kwargs):
+    def __init__(
+        self,
+        url=DEFAULT_URL,
+        password=DEFAULT_PASS,
+        headers=None,
+        pool_size=DEFAULT_POOL_SIZE,
+        **kwargs,
+    ):
         if not url.endswith("/"):
             url += "/"
         self._url = url
         self._headers = headers or DEFAULT_HEADERS
         self._auth = ("", password)
-        self._kwargs = {
-            "auth": self._auth,
-        }
+        # Basic auth with an empty user name, encoded once rather than per request
+        self._auth_header = "Basic " + base64.b64encode(
+            f":{password}".encode("utf-8")
+        ).decode("utf-8")
+        self._kwargs = dict(DEFAULT_KWARGS)
         self._kwargs.update(kwargs)
 
+        # A single session keeps connections alive between requests
+        self._session = requests.Session()
+        self._session.auth = _HeaderAuth(self._auth_header)
+        self._session.headers.update(self._headers)
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         return False
 
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
     @property
     def url(self) -> str:
         return self._url
 
+    def _join(self, path) -> str:
+        """
+        Builds the absolute URL of a device path.
+
+        The base URL always ends with a slash, so plain concatenation is enough
+        and avoids parsing both URLs with `urljoin` on every request.
+
+        Args:
+            path: A path relative to the device's base URL.
+
+        Returns:
+            The absolute URL as a string.
+        """
+        return self._url + path.lstrip("/")
+
     @property
     def password(self) -> str:
         return self._auth[1]
 
+    @property
+    def auth_header(self) -> str:
+        """The value of the Authorization header sent with every request."""
+        return self._auth_header
+
     @request_exception_wrapper
     def options(self):
         """
@@ -107,41 +193,44 @@ class Client:
         Returns:
             The requests.Response object.
         """
-        resp = requests.options(urljoin(self._url, "fs/"), **self._kwargs)
+        resp = self._session.options(self._join("fs/"), **self._kwargs)
         resp.raise_for_status()
         return resp
 
     @request_exception_wrapper
-    def get(self, path):
+    def get(self, path, stream=False, headers=None):
         """
         Send a GET request to the device to retrieve data.
 
         Args:
             path: The path of the resource to retrieve.
+            stream: If True, the response body is not read until it is iterated.
+            headers: Extra HTTP headers merged over the client's default headers.
 
         Returns:
             The requests.Response object.
         """
-        resp = requests.get(
-            urljoin(self._url, path), headers=self._headers, **self._kwargs
+        resp = self._session.get(
+            self._join(path), stream=stream, headers=headers, **self._kwargs
         )
         resp.raise_for_status()
         return resp
 
     @request_exception_wrapper
-    def put(self, path, data=None):
+    def put(self, path, data=None, headers=None):
         """
         Send a PUT request to the device to create/update a file or directory.
 
         Args:
             path: The path of the resource to create or update.
             data: The data to send with the request (e.g., file content).
+            headers: Extra HTTP headers merged over the client's default headers.
 
         Returns:
             The requests.Response object.
         """
-        resp = requests.put(
-            urljoin(self._url, path), data=data, headers=self._headers, **self._kwargs
+        resp = self._session.put(
+            self._join(path), data=data, headers=headers, **self._kwargs
         )
         resp.raise_for_status()
         return resp
@@ -158,10 +247,12 @@ class Client:
         Returns:
             The requests.Response object.
         """
-        headers = dict(self._headers)
-        headers["X-Destination"] = dest_path
-        resp = requests.request(
-            "MOVE", urljoin(self._url, src_path), headers=headers, **self._kwargs
+        # Session headers are merged in by requests, only the delta is passed
+        resp = self._session.request(
+            "MOVE",
+            self._join(src_path),
+            headers={"X-Destination": dest_path},
+            **self._kwargs,
         )
         resp.raise_for_status()
         return resp
@@ -177,9 +268,7 @@ class Client:
         Returns:
             The requests.Response object.
         """
-        resp = requests.delete(
-            urljoin(self._url, path), headers=self._headers, **self._kwargs
-        )
+        resp = self._session.delete(self._join(path), **self._kwargs)
         resp.raise_for_status()
         return resp
 
@@ -224,6 +313,86 @@ class Client:
         webbrowser.open(url)
 
 
+def _map_concurrently(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Calls a function on each item in a thread pool.
+
+    The first failure cancels all calls that haven't started yet and is re-raised.
+
+    Args:
+        func: The function to call with each item.
+        items: The items to process.
+        max_workers: The maximum number of concurrent calls.
+
+    Yields:
+        Each item once its call has completed, in completion order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(func, item): item for item in items}
+        try:
+            for future in as_completed(futures):
+                future.result()
+                yield futures[future]
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+
+def _is_unchanged(stat, entry) -> bool:
+    """
+    Checks whether a local file matches a file listed on the device.
+
+    Args:
+        stat: The local file's os.stat_result, or None if it doesn't exist.
+        entry: The device's directory entry for the file, or None if missing.
+
+    Returns:
+        True if both exist with the same size and modification times within
+        MTIME_TOLERANCE_NS of each other.
+    """
+    if stat is None or entry is None or entry.get("directory"):
+        return False
+    modified_ns = entry.get("modified_ns")
+    return (
+        modified_ns is not None
+        and stat.st_size == entry.get("file_size")
+        and abs(stat.st_mtime_ns - modified_ns) <= MTIME_TOLERANCE_NS
+    )
+
+
+def _is_part_file(name: str) -> bool:
+    """Checks whether a file name is a (possibly leftover) download in progress."""
+    return name.startswith(PART_PREFIX) and name.endswith(PART_SUFFIX)
+
+
+def _scandir_tree(top: os.PathLike, prefix: str):
+    """
+    Walks a local directory tree with `os.scandir`.
+
+    Entry types come from the directory listing itself, so no extra `stat` call
+    or `Path` object is needed per entry. A directory is always yielded before
+    its contents. Symlinked directories are yielded but not descended into.
+
+    Args:
+        top: The local directory to walk.
+        prefix: The POSIX path that `top` maps to, used to build relative paths.
+
+    Yields:
+        A (entry, rel_path) tuple for each file and directory, where rel_path is
+        the entry's POSIX path below `prefix`.
+    """
+    stack = [(top, prefix)]
+    while stack:
+        path, rel_dir = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                rel_path = f"{rel_dir}/{entry.name}"
+                yield entry, rel_path
+                # Like Path.rglob, don't descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path))
+
+
 def ptree(tree_dict, prefix="", path_root=None):
     """
     Prints a formatted tree from a dictionary representation of a file system.
@@ -236,34 +405,40 @@ def ptree(tree_dict, prefix="", path_root=None):
     if path_root:
         print(Path(path_root).as_posix() + "/")
 
-    items = list(tree_dict.items())
-    for i, (path, content) in enumerate(items):
+    # Each stack entry is (prefix, items, index of the next item to print)
+    stack = [(prefix, list(tree_dict.items()), 0)]
+    while stack:
+        prefix, items, i = stack.pop()
+        if i >= len(items):
+            continue
+        stack.append((prefix, items, i + 1))
+
+        path, content = items[i]
         is_last = i == len(items) - 1
-        name = Path(path).name
+        name = path.rpartition("/")[2]
 
         new_prefix_item = "└── " if is_last else "├── "
         new_next_prefix = prefix + ("    " if is_last else "│   ")
 
         if isinstance(content, dict):
             print(f"{prefix}{new_prefix_item}{name}/")
-            ptree(content, prefix=new_next_prefix)
+            stack.append((new_next_prefix, list(content.items()), 0))
         elif isinstance(content, str) and content.startswith("Error"):
             print(f"{prefix}{new_prefix_item}{RED}{name} ({content}){RESET}")
         else:
-            display_name = f"{prefix}{new_prefix_item}{name}"
-
-            if name.endswith(".py"):
-                print(f"{GREEN}{display_name}{RESET}")
-            elif name.endswith(".mpy"):
-                print(f"{YELLOW}{display_name}{RESET}")
-            else:
-                print(f"{RED}{display_name}{RESET}")
+            _, dot, ext = name.rpartition(".")
+            color = EXT_COLORS.get(ext, RED) if dot else RED
+            print(f"{color}{prefix}{new_prefix_item}{name}{RESET}")
 
 
 class Device:
     """
     Represents a CircuitPython device and its local cache.
 
+    The device version and the cache directory are loaded lazily, on the first
+    access to `uid`, `version` or `cache_path`, so operations that only read from
+    the device don't pay for them.
+
     Args:
         client: An instance of the Client class for communication.
         local_path: The path to the local cache directory.
@@ -271,11 +446,34 @@ class Device:
 
     def __init__(self, client: Client, local_path: os.PathLike = DEFAULT_CACHE_PATH):
         self.client = client
-        self._version = self.client.cp_version().json()
-        if not self.uid:
-            raise UnknownCircuitPythonDevice("Unknown CircuitPython UID")
-        self._cache_path: Path = Path(local_path) / self.uid
-        self._init_cache()
+        self._local_path = Path(local_path)
+        self._lock = threading.RLock()
+        self._version_bytes = None
+        self._version = None
+        self._cache_path = None
+        self._disk_info = None
+        self._disk_info_expiry = 0.0
+
+    def _load_version(self):
+        """
+        Fetches the device version on first use.
+
+        Returns:
+            A dictionary with version details.
+
+        Raises:
+            UnknownCircuitPythonDevice: If the device doesn't report a UID.
+        """
+        if self._version is None:
+            with self._lock:
+                if self._version is None:
+                    version_bytes = self.client.cp_version().content
+                    version = json_loads(version_bytes)
+                    if not version.get("UID", None):
+                        raise UnknownCircuitPythonDevice("Unknown CircuitPython UID")
+                    self._version_bytes = version_bytes
+                    self._version = version
+        return self._version
 
     @property
     def uid(self):
@@ -283,9 +481,12 @@ class Device:
         The unique ID of the CircuitPython device.
 
         Returns:
-            The UID as a string, or None if not found.
+            The UID as a string.
+
+        Raises:
+            UnknownCircuitPythonDevice: If the device doesn't report a UID.
         """
-        return self._version.get("UID", None)
+        return self._load_version()["UID"]
 
     @property
     def version(self):
@@ -295,17 +496,28 @@ class Device:
         Returns:
             A dictionary with version details.
         """
-        return self._version
+        return self._load_version()
 
     @property
     def disk_info(self):
         """
         The disk usage information of the device.
 
+        Cached for DISK_INFO_TTL seconds; use `refresh_disk_info` to re-fetch
+        sooner. The cache is also dropped after every pull and push.
+
         Returns:
             A dictionary with disk usage details.
         """
-        return self.client.cp_diskinfo().json()
+        now = time.monotonic()
+        if self._disk_info is None or now >= self._disk_info_expiry:
+            self._disk_info = json_loads(self.client.cp_diskinfo().content)
+            self._disk_info_expiry = now + DISK_INFO_TTL
+        return self._disk_info
+
+    def refresh_disk_info(self):
+        """Drops the cached disk usage information so the next access re-fetches it."""
+        self._disk_info = None
 
     @property
     def list_backups(self):
@@ -315,23 +527,30 @@ class Device:
         Returns:
             A list of Path objects for each backup.
         """
-        return list((self._cache_path / "_bak").iterdir())
+        return list((self.cache_path / "_bak").iterdir())
 
     @property
     def cache_path(self):
         """
         The path to the local cache directory for the device.
 
+        The directory is created on first access.
+
         Returns:
             A Path object representing the cache directory.
         """
+        if self._cache_path is None:
+            with self._lock:
+                if self._cache_path is None:
+                    cache_path = self._local_path / self.uid
+                    self._init_cache(cache_path)
+                    self._cache_path = cache_path
         return self._cache_path
 
-    def _init_cache(self):
+    def _init_cache(self, cache_path: Path):
         """Initializes the local cache directory."""
-        os.makedirs(self._cache_path, exist_ok=True)
-        with open(self._cache_path / "version.py", "w") as fp:
-            json.dump(self._version, fp)
+        os.makedirs(cache_path, exist_ok=True)
+        (cache_path / "version.json").write_bytes(self._version_bytes)
 
     @staticmethod
     def auto_backup(cache_path: os.PathLike = DEFAULT_CACHE_PATH):
@@ -381,131 +600,251 @@ class Device:
         except OSError:
             print("Failed to restore backup of CircuitPython device.")
 
-    def tree(self, path: os.PathLike = "fs/", tree_=None):
+    def _walk(self, root: PurePosixPath, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Lists a directory tree on the device breadth first.
+
+        Directory listings run concurrently; a subdirectory is listed as soon as
+        its parent's listing arrives.
+
+        Args:
+            root: The directory to start from.
+            max_workers: The maximum number of concurrent directory listings.
+
+        Yields:
+            A (path, files, error) tuple for each directory, in completion order,
+            where files is the device's list of entries, or None with the
+            exception in error if the directory couldn't be listed.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {}
+
+        def _list(path):
+            futures[executor.submit(self.client.get, path.as_posix() + "/")] = path
+
+        try:
+            _list(root)
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = futures.pop(future)
+                    try:
+                        files = json_loads(future.result().content).get("files", [])
+                    except Exception as e:
+                        yield path, None, e
+                        continue
+
+                    for f in files:
+                        if f.get("directory"):
+                            _list(path / f.get("name"))
+                    yield path, files, None
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _entries(self, root: PurePosixPath, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Yields every entry below a device directory.
+
+        Directories that can't be listed are skipped.
+
+        Args:
+            root: The directory to start from.
+            max_workers: The maximum number of concurrent directory listings.
+
+        Yields:
+            A (path, entry) tuple, where path is the entry's POSIX path as a
+            string and entry is the dictionary the device reports for it
+            (name, directory, file_size, modified_ns).
+        """
+        for path, files, error in self._walk(root, max_workers):
+            if error:
+                continue
+
+            # Plain string joins, no path object per entry
+            dir_path = path.as_posix().rstrip("/") + "/"
+            for f in files:
+                yield dir_path + f.get("name"), f
+
+    def tree(
+        self,
+        path: os.PathLike = "fs/",
+        tree_=None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
         """
-        Recursively builds a dictionary representation of the device's file system.
+        Builds a dictionary representation of the device's file system.
 
         Args:
             path: The starting path to build the tree from.
-            tree_: An existing dictionary to append the tree to (for recursion).
+            tree_: An existing dictionary to append the tree to.
+            max_workers: The maximum number of concurrent directory listings.
 
         Returns:
             A dictionary representing the file system tree.
         """
-        path = Path(path)
+        path = PurePosixPath(Path(path).as_posix())
         if tree_ is None:
             tree_ = {}
 
-        current_tree = {}
-        tree_[path.as_posix()] = current_tree
+        tree_[path.as_posix()] = {}
+        # The dictionary holding each directory that is still to be listed
+        parents = {path: tree_}
 
-        try:
-            resp = self.client.get(path.as_posix() + "/")
-            j = resp.json()
-        except Exception as e:
-            tree_[path.as_posix()] = f"Error: {e}"
-            return tree_
-
-        files = j.get("files", [])
-        for f in files:
-            name = f.get("name")
-            is_dir = f.get("directory")
-            p = path / name
-            if is_dir:
-                self.tree(p, current_tree)
-            else:
-                current_tree[p.as_posix()] = None
+        for p, files, error in self._walk(path, max_workers):
+            parent = parents.pop(p)
+            if error:
+                parent[p.as_posix()] = f"Error: {error}"
+                continue
+
+            current_tree = parent[p.as_posix()]
+            for f in files:
+                name = f.get("name")
+                is_dir = f.get("directory")
+                child = p / name
+                if is_dir:
+                    current_tree[child.as_posix()] = {}
+                    parents[child] = current_tree
+                else:
+                    current_tree[child.as_posix()] = None
 
         return tree_
 
     def glob(
-        self, pattern: str = None, *, root_path: os.PathLike = "fs/"
+        self,
+        pattern: str = None,
+        *,
+        root_path: os.PathLike = "fs/",
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> Iterator[str]:
         """
         Recursively collects and yields file and directory paths from the device.
 
+        Directories are listed concurrently, so paths are yielded breadth first
+        rather than in listing order. Directories that can't be listed are skipped.
+
         Args:
             pattern: A Unix-style glob pattern to match filenames (e.g., "*.py").
             root_path: The starting path to glob from.
+            max_workers: The maximum number of concurrent directory listings.
 
         Yields:
             The path of a file or directory as a string.
         """
-        root_path = Path(root_path)
+        root_path = PurePosixPath(Path(root_path).as_posix())
 
         # Handle the root path itself
         if not pattern:
             yield root_path.as_posix() + "/"
 
-        def _recursive_glob(path: Path, pattern_: str = "*"):
-            """A helper function to recursively find and yield paths matching a pattern."""
-            try:
-                resp = self.client.get(path.as_posix() + "/")
-                j = resp.json()
-            except ClientRequestError:
-                return
-
-            files = j.get("files", [])
-            for f in files:
-                name = f.get("name")
-                is_dir = f.get("directory")
-                p = path / name
-
-                # Check if the path should be yielded
-                if not pattern_ or fnmatch(p.name, pattern_):
-                    if is_dir:
-                        yield p.as_posix() + "/"
-                    else:
-                        yield p.as_posix()
-
-                # Recurse into subdirectories
-                if is_dir:
-                    # The yield from statement delegates to the inner generator
-                    yield from _recursive_glob(p, pattern_)
-
-        yield from _recursive_glob(root_path, pattern)
+        for path, entry in self._entries(root_path, max_workers):
+            # Check if the path should be yielded
+            if not pattern or fnmatch(entry.get("name"), pattern):
+                if entry.get("directory"):
+                    yield path + "/"
+                else:
+                    yield path
 
-    def pull(self):
+    def pull(self, max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Pulls files from the device to the local cache.
+
+        Directories are created first, then files are downloaded concurrently.
+        Files whose size and modification time match the cached copy are skipped.
+
+        Args:
+            max_workers: The maximum number of concurrent downloads.
         """
-        backup_path = self.auto_backup(self._cache_path)
+        cache_path = self.cache_path
+        backup_path = self.auto_backup(cache_path)
+        files = {}
+
+        def _download(path):
+            dest = cache_path / path
+            self.download(path, dest)
+            modified_ns = files[path].get("modified_ns")
+            if modified_ns is not None:
+                # Mirror the device's mtime so the next sync can skip the file
+                os.utime(dest, ns=(modified_ns, modified_ns))
+            return dest
+
         try:
-            for path in self.glob():
-                print(f"Attempting to pull: {path} ... ", end="")
-                if path.endswith("/"):
-                    self.client.get(path)
-                    os.makedirs(self._cache_path / path, exist_ok=True)
-                    print("Directory created.")
+            dirs, unchanged = ["fs/"], 0
+            for path, entry in self._entries(PurePosixPath("fs"), max_workers):
+                if entry.get("directory"):
+                    dirs.append(path + "/")
+                    continue
+                try:
+                    stat = os.stat(cache_path / path)
+                except FileNotFoundError:
+                    stat = None
+                if _is_unchanged(stat, entry):
+                    unchanged += 1
                 else:
-                    self.download(path, self._cache_path / path)
-                    print("File downloaded.")
-            print("Pull done")
+                    files[path] = entry
+
+            # These directories were just listed, no need to GET them
+            for path in dirs:
+                print(f"Attempting to pull: {path} ... ", end="")
+                os.makedirs(cache_path / path, exist_ok=True)
+                print("Directory created.")
+
+            for path in _map_concurrently(_download, files, max_workers):
+                print(f"Pulled: {path}")
+            print(f"Pull done ({unchanged} unchanged files skipped)")
         except Exception as e:
             print(f"Error: {e}")
             print("Aborting...")
             if backup_path:
-                self.restore_backup(self._cache_path, backup_path)
+                self.restore_backup(cache_path, backup_path)
+        finally:
+            self.refresh_disk_info()
 
-    def push(self):
+    def push(self, max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Pushes files from the local cache to the device.
+
+        Missing directories are created first, parents before children, then
+        files are uploaded concurrently. Files whose size and modification time
+        match the device's copy are skipped.
+
+        Args:
+            max_workers: The maximum number of concurrent uploads.
         """
-        fs = self._cache_path / "fs"
+        fs = self.cache_path / "fs"
+        files = {}
+
+        def _upload(rel_path):
+            return self.upload(rel_path, files[rel_path])
+
         if fs.exists() and fs.is_dir():
             try:
-                for path in fs.rglob("*"):
-                    rel_path = path.relative_to(self._cache_path)
-                    print(f"Attempting to push: {rel_path} ... ", end="")
-                    if path.is_dir():
-                        self.client.put(rel_path.as_posix() + "/")
-                        print("Directory created.")
+                remote = dict(self._entries(PurePosixPath("fs"), max_workers))
+                dirs, unchanged = [], 0
+                for entry, rel_path in _scandir_tree(fs, "fs"):
+                    if entry.is_dir():
+                        if rel_path not in remote:
+                            dirs.append(rel_path)
+                    elif _is_part_file(entry.name):
+                        # Left behind by an interrupted pull, never a device file
+                        continue
+                    elif _is_unchanged(entry.stat(), remote.get(rel_path)):
+                        unchanged += 1
                     else:
-                        self.upload(rel_path.as_posix(), path)
-                        print("File uploaded.")
-                print("Push done")
+                        files[rel_path] = entry.path
+
+                # The walk yields parents before their children
+                for rel_path in dirs:
+                    print(f"Attempting to push: {rel_path} ... ", end="")
+                    self.client.put(rel_path + "/")
+                    print("Directory created.")
+
+                for rel_path in _map_concurrently(_upload, files, max_workers):
+                    print(f"Pushed: {rel_path}")
+                print(f"Push done ({unchanged} unchanged files skipped)")
             except ClientRequestError as e:
                 print(f"Error: {e}")
+            finally:
+                self.refresh_disk_info()
 
     def upload(self, path, filename):
         """
@@ -518,30 +857,71 @@ class Device:
         Returns:
             The requests.Response object.
         """
+        # The file object is streamed by requests with a known Content-Length
         with open(filename, "rb") as fp:
-            return self.client.put(path, data=fp)
+            # Keep the local modification time so unchanged files can be skipped
+            mtime_ms = os.fstat(fp.fileno()).st_mtime_ns // 1_000_000
+            headers = {**UPLOAD_HEADERS, "X-Timestamp": str(mtime_ms)}
+            return self.client.put(path, data=fp, headers=headers)
 
     def download(self, path, dest_filename):
         """
         Download a file from the server to local disk.
 
+        The body is written to a uniquely named temporary file next to the
+        destination and moved into place once complete, so a failed download
+        leaves no partial file behind and concurrent downloads never share a
+        temporary file.
+
         Args:
             path: The path of the file on the device.
             dest_filename: The local path to save the downloaded file to.
 
         Returns:
             The path to the downloaded file.
+
+        Raises:
+            ClientRequestError: If the request fails or the body can't be read.
         """
-        response = self.client.get(path)
-        with open(dest_filename, "wb") as fp:
-            fp.write(response.content)
+        part_filename = os.path.join(
+            os.path.dirname(dest_filename), PART_PREFIX + uuid.uuid4().hex + PART_SUFFIX
+        )
+        with self.client.get(path, stream=True, headers=DOWNLOAD_HEADERS) as response:
+            response.raw.decode_content = True
+            # O_EXCL never reuses an existing file, the mode is subject to umask
+            # like a plain open()
+            flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+            fd = os.open(part_filename, flags, 0o666)
+            try:
+                with open(fd, "wb") as fp:
+                    # The body is read outside Client.get, so wrap its errors too
+                    shutil.copyfileobj(response.raw, fp, DEFAULT_CHUNK_SIZE)
+                os.replace(part_filename, dest_filename)
+            except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+                self._remove_quietly(part_filename)
+                raise ClientRequestError(f"{e}") from e
+            except BaseException:
+                self._remove_quietly(part_filename)
+                raise
         return dest_filename
 
+    @staticmethod
+    def _remove_quietly(filename):
+        """Removes a file, ignoring it if it doesn't exist."""
+        try:
+            os.remove(filename)
+        except FileNotFoundError:
+            pass
+
 
 class Repl:
     """
     Client for interacting with the CircuitPython REPL using asyncio and websockets.
 
+    Only the REPL needs asyncio and a WebSocket client, so methods import them
+    first thing in their body rather than at module level, keeping them off the
+    import path of the file sync commands.
+
     Args:
         client: An instance of a client class that provides the device URL and authentication.
     """
@@ -550,13 +930,74 @@ class Repl:
         self.client = client
         self._is_running = True
 
+    async def _read_stdin(self):
+        """
+        Asynchronously yields lines typed on stdin.
+
+        Stdin is watched by the event loop itself, so no thread is blocked on
+        `input()`. Loops or streams that can't be watched (e.g. the Windows
+        proactor loop or a regular file) fall back to `input()` in the default
+        executor.
+
+        Lines that arrive in the same read (e.g. a paste) are yielded together.
+
+        Yields:
+            A list of lines without their trailing newlines.
+
+        Raises:
+            EOFError: When stdin is closed.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        fd = sys.stdin.fileno()
+        batches = asyncio.Queue()
+        decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")(
+            errors="replace"
+        )
+        partial = ""
+
+        def on_readable():
+            nonlocal partial
+            data = os.read(fd, 4096)
+            if not data:
+                loop.remove_reader(fd)
+                if partial:
+                    batches.put_nowait([partial])
+                batches.put_nowait(None)
+                return
+            *complete, partial = (partial + decoder.decode(data)).split("\n")
+            if complete:
+                batches.put_nowait(complete)
+
+        try:
+            loop.add_reader(fd, on_readable)
+        except (NotImplementedError, OSError):
+            watched = False
+        else:
+            watched = True
+
+        if not watched:
+            while True:
+                yield [await loop.run_in_executor(None, input, "")]
+
+        try:
+            while True:
+                batch = await batches.get()
+                if batch is None:
+                    raise EOFError
+                yield batch
+        finally:
+            loop.remove_reader(fd)
+
     async def run_repl_ws(self):
         """
         Connects to the REPL via a WebSocket and handles input and output asynchronously.
 
         This method will attempt to reconnect indefinitely until the user exits. It
-        creates two separate tasks: one for handling incoming messages from the WebSocket
-        and one for handling user input from the console.
+        creates three separate tasks: one receiving messages from the WebSocket into
+        a queue, one writing queued messages to the console and one for handling
+        user input from the console.
 
         Args:
             None.
@@ -564,15 +1005,16 @@ class Repl:
         Returns:
             None.
         """
+        import asyncio
+
+        import websockets
+
         ws_url = self.client.url.replace("http://", "ws://").replace(
             "https://", "wss://"
         )
         ws_url = urljoin(ws_url, "cp/serial/")
 
-        auth_header = "Basic " + base64.b64encode(
-            f":{self.client.password}".encode("utf-8")
-        ).decode("utf-8")
-        headers = {"Authorization": auth_header}
+        headers = {"Authorization": self.client.auth_header}
 
         print("* Connecting to REPL. Press Ctrl+C or Ctrl+D to exit.")
 
@@ -582,22 +1024,40 @@ class Repl:
                     ws_url, additional_headers=headers, ping_interval=5
                 ) as ws:
                     await ws.send("\r")
+                    messages = asyncio.Queue()
 
-                    async def output_handler():
+                    async def receiver(queue):
+                        # Keeps reading frames while the console is being written
                         try:
                             async for message in ws:
                                 if isinstance(message, bytes):
                                     message = message.decode(errors="replace")
-                                print(message, end="", flush=True)
+                                queue.put_nowait(message)
                         except websockets.exceptions.ConnectionClosed:
                             print("\n* Connection closed by server.", file=sys.stderr)
+                        finally:
+                            queue.put_nowait(None)
+
+                    async def output_handler(queue):
+                        while True:
+                            # Wait for one message, then take whatever else has
+                            # queued up so a burst is written with a single flush
+                            batch = [await queue.get()]
+                            while not queue.empty():
+                                batch.append(queue.get_nowait())
+                            closed = batch[-1] is None
+                            if closed:
+                                batch.pop()
+                            sys.stdout.write("".join(batch))
+                            sys.stdout.flush()
+                            if closed:
+                                return
 
                     async def input_handler():
-                        loop = asyncio.get_running_loop()
                         try:
-                            while True:
-                                line = await loop.run_in_executor(None, input, "")
-                                await ws.send(line + "\r")
+                            # One frame per batch of lines rather than per line
+                            async for lines in self._read_stdin():
+                                await ws.send("\r".join(lines) + "\r")
                                 await asyncio.sleep(0.1)
                         except asyncio.CancelledError:
                             return
@@ -606,14 +1066,16 @@ class Repl:
                             self._is_running = False
                             await ws.close()
 
-                    out_task = asyncio.create_task(output_handler())
+                    recv_task = asyncio.create_task(receiver(messages))
+                    out_task = asyncio.create_task(output_handler(messages))
                     in_task = asyncio.create_task(input_handler())
 
+                    # The output ends once everything received has been written
                     done, pending = await asyncio.wait(
                         [out_task, in_task], return_when=asyncio.FIRST_COMPLETED
                     )
 
-                    for task in pending:
+                    for task in pending | {recv_task}:
                         task.cancel()
 
             except websockets.exceptions.ConnectionClosedError as e:
@@ -629,7 +1091,8 @@ class Repl:
         Starts the asyncio event loop and runs the REPL WebSocket client.
 
         This method is the main entry point for starting the REPL connection. It handles
-        keyboard interrupts and ensures all tasks are properly shut down.
+        keyboard interrupts and ensures all tasks are properly shut down. The faster
+        uvloop event loop is used when it is installed.
 
         Args:
             None.
@@ -637,7 +1100,15 @@ class Repl:
         Returns:
             None.
         """
-        loop = asyncio.new_event_loop()
+        import asyncio
+
+        try:
+            # Optional, faster event loop (not available on Windows)
+            from uvloop import new_event_loop
+        except ImportError:
+            new_event_loop = asyncio.new_event_loop
+
+        loop = new_event_loop()
         asyncio.set_event_loop(loop)
         try:
             loop.run_until_complete(self.run_repl_ws())
@@ -660,6 +1131,8 @@ class Repl2:
     Client for interacting with the CircuitPython REPL using a synchronous websocket library.
 
     This implementation uses a blocking `run_forever` call in a separate thread.
+    The WebSocket client is imported by `run_forever` itself, keeping it off the
+    import path of the file sync commands.
 
     Args:
         client: An instance of a client class that provides the device URL and authentication.
@@ -669,6 +1142,28 @@ class Repl2:
         self.client = client
         self._is_running = True
         self.ws = None
+        self._output = queue.SimpleQueue()
+
+    def _flush_output(self):
+        """
+        Writes buffered messages to stdout, coalescing bursts into a single write.
+
+        Runs in one long-lived thread for the lifetime of `run_forever` and
+        returns once it receives the `None` sentinel.
+        """
+        while True:
+            output = [self._output.get()]
+            # Drain whatever is already queued, but flush at least every 0.1s
+            deadline = time.monotonic() + 0.1
+            while output[-1] is not None and time.monotonic() < deadline:
+                try:
+                    output.append(self._output.get_nowait())
+                except queue.Empty:
+                    break
+            if output[-1] is None:
+                print("".join(output[:-1]), end="", flush=True)
+                return
+            print("".join(output), end="", flush=True)
 
     def on_message(self, ws, message):
         """
@@ -680,7 +1175,7 @@ class Repl2:
         """
         if isinstance(message, bytes):
             message = message.decode(errors="replace")
-        print(message, end="", flush=True)
+        self._output.put(message)
 
     def on_error(self, ws, error):
         """
@@ -736,32 +1231,38 @@ class Repl2:
         Returns:
             None.
         """
+        import websocket
+
         ws_url = self.client.url.replace("http://", "ws://").replace(
             "https://", "wss://"
         )
         ws_url = ws_url.rstrip("/") + "/cp/serial/"
 
-        auth_header = "Basic " + base64.b64encode(
-            f":{self.client.password}".encode("utf-8")
-        ).decode("utf-8")
-
-        while self._is_running:
-            self.ws = websocket.WebSocketApp(
-                ws_url,
-                header={"Authorization": auth_header},
-                on_open=self.on_open,
-                on_message=self.on_message,
-                on_error=self.on_error,
-                on_close=self.on_close,
-            )
+        flusher = threading.Thread(target=self._flush_output, daemon=True)
+        flusher.start()
 
-            try:
-                self.ws.run_forever(ping_interval=5)
-            except KeyboardInterrupt:
-                print("\n* Interrupted, closing connection...")
-                self._is_running = False
-                break
-
-            if self._is_running:
-                print("* Reconnecting in 1s...")
-                time.sleep(1)
+        try:
+            while self._is_running:
+                self.ws = websocket.WebSocketApp(
+                    ws_url,
+                    header={"Authorization": self.client.auth_header},
+                    on_open=self.on_open,
+                    on_message=self.on_message,
+                    on_error=self.on_error,
+                    on_close=self.on_close,
+                )
+
+                try:
+                    self.ws.run_forever(ping_interval=5)
+                except KeyboardInterrupt:
+                    print("\n* Interrupted, closing connection...")
+                    self._is_running = False
+                    break
+
+                if self._is_running:
+                    print("* Reconnecting in 1s...")
+                    time.sleep(1)
+        finally:
+            # Stop the flusher once everything queued so far is written
+            self._output.put(None)
+            flusher.join()
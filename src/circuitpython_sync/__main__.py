@@ -1,119 +1,267 @@
 import argparse
+import os
 import sys
-import tempfile
-from pathlib import Path
+from functools import lru_cache
 
 from circuitpython_sync import (
     Client,
     Device,
     DEFAULT_CACHE_PATH,
+    DEFAULT_MAX_WORKERS,
     DEFAULT_URL,
     DEFAULT_PASS,
+    DEFAULT_POOL_SIZE,
     ptree,
-    Repl2,
+    Repl,
 )
 
+# Help texts, looked up by option or command name
+_HELP = {
+    "description": "A command-line tool for managing files on a CircuitPython device via the web workflow.",
+    "command": "Choose a command to execute.",
+    "url": "URL of the CircuitPython device's web workflow (e.g., http://circuitpython.local/)",
+    "password": "Password for the CircuitPython device's web workflow.",
+    "pool_size": "Maximum number of keep-alive connections to the device.",
+    "pull": "Downloads files and directories from the device to a local cache.",
+    "dst": "Local destination path to cache the device's file system.",
+    "push": "Uploads files and directories from a local cache to the device.",
+    "src": "Local source path containing files to push to the device.",
+    "tree": "Displays the file system tree of the CircuitPython device.",
+    "path": "The starting path on the device to display the tree from.",
+    "repl": "Connects to the device's serial REPL over a WebSocket.",
+    "web": "Open the web-based REPL instead of using the command-line client.",
+    "code": "Opens the CircuitPython web code editor.",
+    "files": "Opens the CircuitPython web file browser.",
+    "pull_concurrency": "Maximum number of concurrent downloads.",
+    "push_concurrency": "Maximum number of concurrent uploads.",
+}
 
-def main(args=None):
+
+def _positive_int(value):
     """
-    Main entry point for the command-line tool.
+    Argparse type for options that must be a positive integer.
+
+    Args:
+        value: The option's value from the command line.
+
+    Returns:
+        The value as an int.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer above zero.
     """
-    common_parser = argparse.ArgumentParser(add_help=False)
-    common_parser.add_argument(
-        "-u",
-        "--url",
-        type=str,
-        help="URL of the CircuitPython device's web workflow (e.g., http://circuitpython.local/)",
-        default=DEFAULT_URL,
-    )
-    common_parser.add_argument(
-        "-p",
-        "--password",
-        type=str,
-        help="Password for the CircuitPython device's web workflow.",
-        default=DEFAULT_PASS,
-    )
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
 
-    ap = argparse.ArgumentParser(
-        description="A command-line tool for managing files on a CircuitPython device via the web workflow.",
-        parents=[common_parser],
-    )
-    subparsers = ap.add_subparsers(
-        dest="command", help="Choose a command to execute.", required=True
+
+def _add_concurrency_argument(parser, help_):
+    """Adds the --concurrency option to a file transfer command parser."""
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        help=help_,
+        default=DEFAULT_MAX_WORKERS,
     )
 
-    # Parser for the 'pull' command
+
+def _build_pull(subparsers, common_parser):
+    """Adds the 'pull' command parser."""
     pull_parser = subparsers.add_parser(
         "pull",
-        help="Downloads files and directories from the device to a local cache.",
+        help=_HELP["pull"],
         parents=[common_parser],
     )
     pull_parser.add_argument(
         "--dst",
-        type=Path,
-        help="Local destination path to cache the device's file system.",
+        help=_HELP["dst"],
         default=DEFAULT_CACHE_PATH,
     )
+    _add_concurrency_argument(pull_parser, _HELP["pull_concurrency"])
+
 
-    # Parser for the 'push' command
+def _build_push(subparsers, common_parser):
+    """Adds the 'push' command parser."""
     push_parser = subparsers.add_parser(
         "push",
-        help="Uploads files and directories from a local cache to the device.",
+        help=_HELP["push"],
         parents=[common_parser],
     )
     push_parser.add_argument(
         "--src",
-        type=Path,
-        help="Local source path containing files to push to the device.",
+        help=_HELP["src"],
         default=DEFAULT_CACHE_PATH,
     )
+    _add_concurrency_argument(push_parser, _HELP["push_concurrency"])
 
-    # Parser for the 'tree' command
+
+def _build_tree(subparsers, common_parser):
+    """Adds the 'tree' command parser."""
     tree_parser = subparsers.add_parser(
         "tree",
-        help="Displays the file system tree of the CircuitPython device.",
+        help=_HELP["tree"],
         parents=[common_parser],
     )
     tree_parser.add_argument(
         "--path",
-        type=Path,
-        help="The starting path on the device to display the tree from.",
+        help=_HELP["path"],
         default="fs/",
     )
 
-    # Parser for the 'repl' command
+
+def _build_repl(subparsers, common_parser):
+    """Adds the 'repl' command parser."""
     repl_parser = subparsers.add_parser(
         "repl",
-        help="Connects to the device's serial REPL over a WebSocket.",
+        help=_HELP["repl"],
         parents=[common_parser],
     )
     repl_parser.add_argument(
         "--web",
         action="store_true",
-        help="Open the web-based REPL instead of using the command-line client.",
+        help=_HELP["web"],
     )
 
-    code_parser = subparsers.add_parser(
-        "code", help="Opens the CircuitPython web code editor.", parents=[common_parser]
+
+def _build_code(subparsers, common_parser):
+    """Adds the 'code' command parser."""
+    subparsers.add_parser("code", help=_HELP["code"], parents=[common_parser])
+
+
+def _build_files(subparsers, common_parser):
+    """Adds the 'files' command parser."""
+    subparsers.add_parser("files", help=_HELP["files"], parents=[common_parser])
+
+
+# Command name -> subparser builder, in the order shown by --help
+_SUBPARSER_BUILDERS = {
+    "pull": _build_pull,
+    "push": _build_push,
+    "tree": _build_tree,
+    "repl": _build_repl,
+    "code": _build_code,
+    "files": _build_files,
+}
+
+
+def _build_common_parser(url, password, pool_size):
+    """
+    Builds a parent parser holding the options shared by every command.
+
+    Args:
+        url: The default of --url.
+        password: The default of --password.
+        pool_size: The default of --pool-size.
+
+    Returns:
+        An argparse.ArgumentParser without a help option.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("-u", "--url", type=str, help=_HELP["url"], default=url)
+    parser.add_argument(
+        "-p", "--password", type=str, help=_HELP["password"], default=password
+    )
+    parser.add_argument(
+        "--pool-size", type=_positive_int, help=_HELP["pool_size"], default=pool_size
     )
+    return parser
 
-    files_parser = subparsers.add_parser(
-        "files",
-        help="Opens the CircuitPython web file browser.",
-        parents=[common_parser],
+
+# Options shared by the top-level parser and every command. The command parsers
+# get a copy without defaults, so they don't overwrite values given before the
+# command name (e.g. `--pool-size 4 pull`)
+_COMMON_PARSER = _build_common_parser(DEFAULT_URL, DEFAULT_PASS, DEFAULT_POOL_SIZE)
+_COMMAND_COMMON_PARSER = _build_common_parser(
+    argparse.SUPPRESS, argparse.SUPPRESS, argparse.SUPPRESS
+)
+
+
+class _CommandScanner(argparse.ArgumentParser):
+    """Parser that raises on errors instead of printing usage and exiting."""
+
+    def error(self, message):
+        raise argparse.ArgumentError(None, message)
+
+
+# Consumes the common options exactly as the real parser would (abbreviations,
+# --opt=value) to find where the command starts
+_COMMAND_SCANNER = _CommandScanner(add_help=False, parents=[_COMMON_PARSER])
+
+
+def _find_command(argv):
+    """
+    Finds the command name among the command-line arguments.
+
+    Args:
+        argv: The command-line arguments, without the program name.
+
+    Returns:
+        The command name, or None if an option (e.g. -h) or an invalid argument
+        comes before it, or there is no command at all.
+    """
+    try:
+        _, rest = _COMMAND_SCANNER.parse_known_args(argv)
+    except argparse.ArgumentError:
+        return None
+    if rest and not rest[0].startswith("-"):
+        return rest[0]
+    return None
+
+
+@lru_cache(maxsize=4)
+def _build_parser(command=None):
+    """
+    Builds the command-line parser.
+
+    Parsers hold no state between parses, so each one is built once per
+    process and reused by later `main()` calls.
+
+    Args:
+        command: The command whose subparser is needed, or None for all of them.
+
+    Returns:
+        The top-level argparse.ArgumentParser.
+    """
+    ap = argparse.ArgumentParser(
+        description=_HELP["description"],
+        parents=[_COMMON_PARSER],
     )
+    subparsers = ap.add_subparsers(dest="command", help=_HELP["command"], required=True)
+
+    if command is not None:
+        _SUBPARSER_BUILDERS[command](subparsers, _COMMAND_COMMON_PARSER)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers, _COMMAND_COMMON_PARSER)
+    return ap
+
+
+def main(args=None):
+    """
+    Main entry point for the command-line tool.
+    """
+    argv = args or sys.argv[1:]
 
-    ns = ap.parse_args(args or sys.argv[1:])
+    # Only the invoked command's parser is needed; help and unknown commands
+    # get all of them so the usage and error messages stay complete
+    command = _find_command(argv)
+    if command not in _SUBPARSER_BUILDERS:
+        command = None
+    ns = _build_parser(command).parse_args(argv)
 
     try:
-        with Client(ns.url, ns.password) as client:
+        with Client(ns.url, ns.password, pool_size=ns.pool_size) as client:
             if ns.command == "pull":
-                Device(client, ns.dst).pull()
+                Device(client, ns.dst).pull(ns.concurrency)
             elif ns.command == "push":
-                Device(client, ns.src).push()
+                Device(client, ns.src).push(ns.concurrency)
             elif ns.command == "tree":
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    ptree(Device(client, Path(tmpdir)).tree(ns.path))
+                # The cache directory is created lazily and tree() never needs it
+                ptree(Device(client).tree(ns.path))
             elif ns.command == "code":
                 client.code_web()
             elif ns.command == "files":
@@ -122,10 +270,12 @@ def main(args=None):
                 if ns.web:
                     client.repl_web()
                 else:
-                    Repl2(client).run_forever()
+                    Repl(client).start_repl()
 
     except KeyboardInterrupt:
-        print("Interrupted.", file=sys.stderr)
+        # Unbuffered, so the message survives even if sys.stderr is torn down
+        os.write(2, b"Interrupted.\n")
+        raise SystemExit(130)  # 128 + SIGINT
 
 
 if __name__ == "__main__":